@@ -3,21 +3,50 @@ from __future__ import annotations
 
 import argparse
 import concurrent.futures as cf
+import hashlib
+import itertools
+import json
 import logging
+import random
 import re
+import string
+import sys
+import tempfile
 import threading
 import time
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, Iterator, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 from deep_translator import GoogleTranslator
 from deep_translator.exceptions import LanguageNotSupportedException
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_SOURCE = ROOT / "en" / "index.qmd"
-PROTECTED_INLINE_RE = re.compile(r"(`[^`]*`|\$\$[\s\S]*?\$\$|\$[^$\n]*\$|\[.*?\]\(.*?\))", re.DOTALL)
-SKIP_RE = re.compile(r"^[\s\d#>*\-`~:;,.!\[\](){}+=_/\\|]+$")
+# Negated character classes instead of lazy ".*?" avoid catastrophic backtracking on lines with stray delimiters.
+PROTECTED_INLINE_RE = re.compile(r"`[^`\n]*`|\$\$[^$]*\$\$|\$[^$\n]*\$|\[[^\]\n]*\]\([^)\n]*\)")
+TOKEN_RE = re.compile(r"⟪XTK\d+⟫")
+# Chunks made only of these (whitespace, digits, markdown punctuation) have nothing to translate.
+SKIP_CHARS = frozenset(string.whitespace + string.digits + "#>*-`~:;,.![](){}+=_/\\|")
+CORE_RE = re.compile(r"\S(?:.*\S)?", re.DOTALL)
+NEWLINE_RE = re.compile("\n")
+MARKER_LINE_RE = re.compile(r"^[^\S\n]*(```|~~~|\$\$).*\n?", re.MULTILINE)
+BATCH_SEP = "\n\n@@SEP{}@@\n\n"
+BATCH_SEP_RE = re.compile(r"\s*@@\s*SEP\s*\d+\s*@@\s*")
+# Google rejects requests above 5000 characters; leave headroom for separators.
+BATCH_CHAR_LIMIT = 4800
+# Scripts that identify text already in the target language, keyed by base language code.
+TARGET_SCRIPT_RE = {
+    "zh": re.compile("[\u3400-\u9fff]"),
+    "ja": re.compile("[\u3040-\u30ff\u3400-\u9fff]"),
+    "ko": re.compile("[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af]"),
+}
+NON_SPACE_RE = re.compile(r"\S")
+KANA_RE = re.compile("[\u3040-\u30ff]")
+T = TypeVar("T")
 LANGUAGE_ALIASES = {
     # Google Translate does not currently expose Pali.
     # Use Sanskrit as a practical fallback for generating an Indic translation draft.
@@ -28,10 +57,12 @@ LANGUAGE_ALIASES = {
 class GoogleTranslateHttpClient:
     """Fallback translator that calls Google's public translate endpoint."""
 
-    def __init__(self, source: str, target: str) -> None:
+    def __init__(self, source: str, target: str, pool_size: int = 10) -> None:
         self.source = source
         self.target = target
+        # One keep-alive pool shared by all worker threads, so each request reuses a warm TLS connection.
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
 
     def translate(self, text: str) -> str:
         resp = self.session.get(
@@ -72,48 +103,192 @@ class RateLimiter:
     next_ts: float = 0.0
 
     def wait(self) -> None:
+        # Reserve the next slot under the lock, but sleep outside it so waiters don't queue on the mutex.
         with self.lock:
             now = time.monotonic()
-            if now < self.next_ts:
-                time.sleep(self.next_ts - now)
-                now = time.monotonic()
-            self.next_ts = now + self.interval_s
+            slot = max(now, self.next_ts)
+            self.next_ts = slot + self.interval_s
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass
+class TranslationCache:
+    """Chunk translations keyed by a blake2b digest of the source text, persisted as JSON."""
+
+    path: Path | None = None
+    entries: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path | None) -> TranslationCache:
+        if path is None or not path.exists():
+            return cls(path=path)
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError as exc:
+            logging.warning("ignoring unreadable translation cache %s: %s", path, exc)
+            return cls(path=path)
+        return cls(path=path, entries=entries)
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, text: str) -> str | None:
+        return self.entries.get(self.key(text))
+
+    def put(self, text: str, translated: str) -> None:
+        self.entries[self.key(text)] = translated
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # A private temp file per save, so concurrent runs can't clobber each other's half-written JSON.
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.path.parent, suffix=".tmp", delete=False) as fh:
+            json.dump(self.entries, fh, ensure_ascii=False)
+        Path(fh.name).replace(self.path)
+
+
+@dataclass
+class ShardedRateLimiter:
+    """Splits a global rate across worker threads, each waiting only on its own RateLimiter."""
+
+    interval_s: float
+    shards: int
+    local: threading.local = field(default_factory=threading.local)
+    ids: itertools.count = field(default_factory=itertools.count)
+
+    def wait(self) -> None:
+        limiter = getattr(self.local, "limiter", None)
+        if limiter is None:
+            # Stagger each shard's first slot so workers don't all fire at once on start-up.
+            k = next(self.ids) % self.shards
+            limiter = self.local.limiter = RateLimiter(interval_s=self.interval_s * self.shards, next_ts=time.monotonic() + k * self.interval_s)
+        limiter.wait()
+
+
+@dataclass
+class CircuitBreaker:
+    """Trips after consecutive failures across all workers and makes them skip requests for a cooldown."""
+
+    threshold: int = 5
+    cooldown_s: float = 30.0
+    failures: int = 0
+    open_until: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+    def record(self, ok: bool) -> None:
+        with self.lock:
+            if ok:
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.failures = 0
+                self.open_until = time.monotonic() + self.cooldown_s
+                logging.warning("%d consecutive failures; pausing requests for %.0fs", self.threshold, self.cooldown_s)
+
+
+@dataclass
+class ProtectedChunk:
+    """A chunk to translate, with its inline code/math/links already swapped for placeholders."""
+
+    idx: int
+    text: str
+    protected: str
+    mapping: dict[str, str]
+
+    @classmethod
+    def from_text(cls, idx: int, text: str) -> ProtectedChunk:
+        return cls(idx, text, *protect_inline(text))
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Translate QMD/Markdown with chunking, parallelism, and detailed progress logs")
     p.add_argument("--source-lang", default="en")
     p.add_argument("--target-lang", default="ja")
+    p.add_argument("--target-langs", default="", help="comma-separated targets translated in parallel, one process each; overrides --target-lang")
     p.add_argument("--source", default=str(DEFAULT_SOURCE.relative_to(ROOT)))
     p.add_argument("--output", default="")
     p.add_argument("--chunk-size", type=int, default=2600)
+    p.add_argument("--batch-chars", type=int, default=BATCH_CHAR_LIMIT, help="max characters per translate request when batching chunks")
     p.add_argument("--max-workers", type=int, default=8)
-    p.add_argument("--rate-limit", type=float, default=6.0)
+    p.add_argument("--rate-limit", type=float, default=6.0, help="requests per second, per target language")
     p.add_argument("--retries", type=int, default=4)
+    p.add_argument("--backend", choices=["http", "auto", "deep-translator"], default="http", help="http reuses pooled keep-alive connections; auto tries deep-translator first and falls back to http for unsupported languages")
+    p.add_argument("--cache-dir", default=".translate_cache", help="directory for per-language translation caches; empty disables")
     p.add_argument("--verbose", action="store_true")
-    return p.parse_args()
+    args = p.parse_args()
+    # Repeated targets would have two processes writing the same output and cache files.
+    args.targets = list(dict.fromkeys(t.strip() for t in args.target_langs.split(",") if t.strip())) or [args.target_lang]
+    if len(args.targets) > 1 and args.output:
+        p.error("--output cannot be combined with multiple --target-langs")
+    return args
 
 
-def setup_logging(verbose: bool) -> None:
-    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO, format="%(asctime)s | %(levelname)-5s | %(message)s", datefmt="%H:%M:%S")
+def setup_logging(verbose: bool, target: str = "") -> None:
+    # Parallel language runs share stderr, so each process tags its records with its target.
+    tag = f"{target} | " if target else ""
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO, format=f"%(asctime)s | %(levelname)-5s | {tag}%(message)s", datefmt="%H:%M:%S", force=True)
 
 
 def split_chunks(text: str, size: int) -> list[str]:
+    newlines = [m.start() for m in NEWLINE_RE.finditer(text)]
+    # Paragraph breaks are adjacent newlines, so they come from the same offsets without rescanning the text.
+    breaks = [a for a, b in zip(newlines, newlines[1:]) if b == a + 1]
     out: list[str] = []
     i = 0
     while i < len(text):
         j = min(len(text), i + size)
         if j < len(text):
-            cut = max(text.rfind("\n\n", i, j), text.rfind("\n", i, j))
+            k = bisect_right(breaks, j - 2)
+            cut = breaks[k - 1] if k else -1
             if cut > i + 120:
-                j = cut + (2 if text[cut:cut+2] == "\n\n" else 1)
+                j = cut + 2
+            else:
+                k = bisect_left(newlines, j)
+                cut = newlines[k - 1] if k else -1
+                if cut > i + 120:
+                    j = cut + (2 if text[cut:cut+2] == "\n\n" else 1)
         out.append(text[i:j])
         i = j
     return out
 
 
+def iter_regions(text: str) -> Iterator[tuple[bool, str]]:
+    """Yield (translatable, text) runs; fenced code and display math are passed through verbatim."""
+    in_code = in_math = False
+    run_start = pos = 0
+    # Only fence/math marker lines can change state, so jump between them instead of walking every line.
+    for m in MARKER_LINE_RE.finditer(text):
+        if not (in_code or in_math) and m.start() > pos:
+            if pos > run_start:
+                yield False, text[run_start:pos]
+            yield True, text[pos:m.start()]
+            run_start = m.start()
+        if m.group(1) == "$$":
+            if not in_code and m.group(0).count("$$") % 2:
+                in_math = not in_math
+        elif not in_math:
+            in_code = not in_code
+        pos = m.end()
+    if not (in_code or in_math) and len(text) > pos:
+        if pos > run_start:
+            yield False, text[run_start:pos]
+        yield True, text[pos:]
+    elif len(text) > run_start:
+        yield False, text[run_start:]
+
+
 def protect_inline(text: str) -> tuple[str, dict[str, str]]:
     mapping: dict[str, str] = {}
+    # Most prose has nothing to protect; skip the regex engine when no pattern can match.
+    if "`" not in text and "$" not in text and "](" not in text:
+        return text, mapping
 
     def repl(match: re.Match[str]) -> str:
         token = f"⟪XTK{len(mapping):04d}⟫"
@@ -124,75 +299,285 @@ def protect_inline(text: str) -> tuple[str, dict[str, str]]:
 
 
 def restore_inline(text: str, mapping: dict[str, str]) -> str:
-    for token, val in mapping.items():
-        text = text.replace(token, val)
-    return text
+    if not mapping:
+        return text
+    return TOKEN_RE.sub(lambda m: mapping.get(m.group(0), m.group(0)), text)
+
+
+def qmd_post_processor(source_lang: str, output_lang: str) -> Callable[[str], str]:
+    """Build a single-pass rewrite that points front matter and artifact links at the output language."""
+    table = {
+        f"lang: {source_lang}\n": f"lang: {output_lang}\n",
+        f"/artifacts/{source_lang}/": f"/artifacts/{output_lang}/",
+    }
+    pattern = re.compile("|".join(map(re.escape, table)))
+    return lambda text: pattern.sub(lambda m: table[m.group(0)], text)
+
+
+def needs_translation(chunk: str) -> bool:
+    return not SKIP_CHARS.issuperset(chunk)
+
+
+def already_target(chunk: str, target: str) -> bool:
+    """True if at least 30% of the chunk's non-space characters are in the target language's script."""
+    base = target.split("-")[0].lower()
+    script = TARGET_SCRIPT_RE.get(base)
+    if script is None or not script.search(chunk):
+        return False
+    # Chinese and Japanese share Han characters; kana is what tells Japanese text apart.
+    if (base == "zh" and KANA_RE.search(chunk)) or (base == "ja" and not KANA_RE.search(chunk)):
+        return False
+    return len(script.findall(chunk)) >= 0.3 * len(NON_SPACE_RE.findall(chunk))
+
+
+def group_chunks(items: list[ProtectedChunk], limit: int) -> list[list[ProtectedChunk]]:
+    # Size by the protected text: that is what gets sent, and placeholders are longer than short inline math.
+    groups: list[list[ProtectedChunk]] = []
+    size = limit
+    for item in items:
+        if size + len(item.protected) > limit:
+            groups.append([])
+            size = 0
+        groups[-1].append(item)
+        size += len(item.protected) + len(BATCH_SEP)
+    return groups
+
+
+def core_span(text: str) -> tuple[int, int]:
+    """Offsets of the text between its leading and trailing whitespace.
+
+    Only this core is sent: the translator trims surrounding whitespace, so callers put the
+    original edges back around the result.
+    """
+    m = CORE_RE.search(text)
+    return m.span() if m else (len(text), len(text))
+
+
+def translate_batch(chunks: list[str], translator: object, limiter: RateLimiter | ShardedRateLimiter) -> list[str] | None:
+    """Translate several chunks in one request; returns None if the separators did not survive."""
+    # Track each chunk's non-whitespace core as offsets so the edges are sliced once, not stripped repeatedly.
+    spans = [core_span(c) for c in chunks]
+    pieces: list[str] = []
+    for i, (c, (a, b)) in enumerate(zip(chunks, spans)):
+        if i:
+            pieces.append(BATCH_SEP.format(i))
+        pieces.append(c[a:b])
+    joined = "".join(pieces)
+    limiter.wait()
+    parts = BATCH_SEP_RE.split((translator.translate(joined) or joined).strip())
+    if len(parts) != len(chunks):
+        return None
+    return ["".join((c[:a], part, c[b:])) for c, (a, b), part in zip(chunks, spans, parts)]
+
+
+def backoff_delay(attempt: int) -> float:
+    # Exponential backoff with full jitter, so retrying workers don't hit the endpoint in lockstep.
+    return random.uniform(0.5, min(30.0, 0.5 * 2 ** attempt))
+
+
+class RetriesExhausted(Exception):
+    """Raised by call_with_retries when a request is given up on."""
+
+
+def call_with_retries(label: str, request: Callable[[], T], retries: int, breaker: CircuitBreaker) -> T:
+    for attempt in range(1, retries + 1):
+        if breaker.is_open():
+            logging.error("%s skipped while circuit is open", label)
+            raise RetriesExhausted(label)
+        try:
+            result = request()
+        except Exception as exc:
+            breaker.record(ok=False)
+            sleep_s = backoff_delay(attempt)
+            logging.warning("%s failed (%d/%d): %s; retry %.1fs", label, attempt, retries, exc, sleep_s)
+            time.sleep(sleep_s)
+            continue
+        breaker.record(ok=True)
+        return result
+    logging.error("%s exhausted retries", label)
+    raise RetriesExhausted(label)
 
 
-def translate_one(idx: int, chunk: str, translator: object, limiter: RateLimiter, retries: int, counter: Counter) -> tuple[int, str]:
-    if not chunk.strip() or SKIP_RE.fullmatch(chunk):
+def translate_one(chunk: ProtectedChunk, translator: object, limiter: RateLimiter | ShardedRateLimiter, retries: int, counter: Counter, breaker: CircuitBreaker) -> tuple[int, str]:
+    if not needs_translation(chunk.text):
         counter.tick()
-        return idx, chunk
+        return chunk.idx, chunk.text
 
-    protected, mapping = protect_inline(chunk)
+    protected = chunk.protected
+    a, b = core_span(protected)
+    core = protected[a:b]
 
-    for attempt in range(1, retries + 1):
-        try:
-            limiter.wait()
-            translated = translator.translate(protected) or protected
-            counter.tick()
-            return idx, restore_inline(translated, mapping)
-        except Exception as exc:
-            sleep_s = min(8, attempt * 1.5)
-            logging.warning("chunk %d failed (%d/%d): %s; retry %.1fs", idx, attempt, retries, exc, sleep_s)
-            time.sleep(sleep_s)
+    def request() -> str:
+        limiter.wait()
+        return translator.translate(core) or core
 
-    logging.error("chunk %d exhausted retries; fallback to source", idx)
+    try:
+        translated = call_with_retries(f"chunk {chunk.idx}", request, retries, breaker)
+        translated = restore_inline("".join((protected[:a], translated, protected[b:])), chunk.mapping)
+    except RetriesExhausted:
+        logging.error("chunk %d fallback to source", chunk.idx)
+        translated = chunk.text
     counter.tick()
-    return idx, chunk
+    return chunk.idx, translated
 
 
-def main() -> None:
-    args = parse_args()
-    setup_logging(args.verbose)
+def translate_group(group: list[ProtectedChunk], translator: object, limiter: RateLimiter | ShardedRateLimiter, retries: int, counter: Counter, breaker: CircuitBreaker) -> list[tuple[int, str]]:
+    if len(group) == 1:
+        return [translate_one(group[0], translator, limiter, retries, counter, breaker)]
+
+    first, last = group[0].idx, group[-1].idx
+    try:
+        parts = call_with_retries(f"batch {first}-{last}", lambda: translate_batch([c.protected for c in group], translator, limiter), retries, breaker)
+    except RetriesExhausted:
+        parts = None
+    if parts is None:
+        logging.warning("batch %d-%d did not come back intact; retrying per chunk", first, last)
+        return [translate_one(c, translator, limiter, retries, counter, breaker) for c in group]
+
+    out = []
+    for c, part in zip(group, parts):
+        counter.tick()
+        out.append((c.idx, restore_inline(part, c.mapping)))
+    return out
+
+
+def translate_book(args: argparse.Namespace) -> None:
+    setup_logging(args.verbose, args.target_lang if len(args.targets) > 1 else "")
 
     src = ROOT / args.source
-    dst = ROOT / (args.output or f"{args.target_lang.split('-')[0].lower()}/index.qmd")
+    output_lang = args.target_lang.split("-")[0].lower()
+    dst = ROOT / (args.output or f"{output_lang}/index.qmd")
     text = src.read_text(encoding="utf-8")
 
-    chunks = split_chunks(text, args.chunk_size)
-    logging.info("start %s -> %s | file=%s | chunks=%d | workers=%d | rate=%.1f/s", args.source_lang, args.target_lang, src.relative_to(ROOT), len(chunks), args.max_workers, args.rate_limit)
+    regions = 0
+    chunks: list[str] = []
+    pending: list[tuple[int, str]] = []
+    for translatable, region in iter_regions(text):
+        regions += 1
+        for chunk in split_chunks(region, args.chunk_size) if translatable else [region]:
+            if translatable and needs_translation(chunk):
+                pending.append((len(chunks), chunk))
+            chunks.append(chunk)
+    logging.info("start %s -> %s | file=%s | regions=%d | chunks=%d | workers=%d | rate=%.1f/s", args.source_lang, args.target_lang, src.relative_to(ROOT), regions, len(chunks), args.max_workers, args.rate_limit)
 
     requested_target = args.target_lang
     resolved_target = LANGUAGE_ALIASES.get(requested_target, requested_target)
     if resolved_target != requested_target:
         logging.warning("target language '%s' is not supported by GoogleTranslator; using fallback '%s'", requested_target, resolved_target)
 
+    translator = None
+    if args.backend != "http":
+        try:
+            translator = GoogleTranslator(source=args.source_lang, target=resolved_target)
+            logging.info("translator backend: deep-translator/google")
+        except LanguageNotSupportedException:
+            if args.backend == "deep-translator":
+                raise
+            logging.warning(
+                "deep-translator does not support '%s'; falling back to Google HTTP endpoint",
+                resolved_target,
+            )
+    if translator is None:
+        translator = GoogleTranslateHttpClient(source=args.source_lang, target=resolved_target, pool_size=args.max_workers)
+        logging.info("translator backend: googleapis HTTP (pool=%d)", args.max_workers)
+
+    cache = TranslationCache.load(ROOT / args.cache_dir / f"{args.source_lang}-{requested_target}.json" if args.cache_dir else None)
+    started = time.time()
+    out = list(chunks)
+
+    # Identical chunks (repeated headings, boilerplate) are translated once; cached ones not at all.
+    copies: dict[str, list[int]] = {}
+    native = 0
+    for i, chunk in pending:
+        # Leave chunks that are already in the target language (re-runs, mixed-language sources) as they are.
+        if already_target(chunk, resolved_target):
+            native += 1
+            continue
+        copies.setdefault(chunk, []).append(i)
+    todo: list[tuple[int, str]] = []
+    for chunk, idxs in copies.items():
+        hit = cache.get(chunk)
+        if hit is None:
+            todo.append((idxs[0], chunk))
+        else:
+            for i in idxs:
+                out[i] = hit
+
+    groups = group_chunks([ProtectedChunk.from_text(i, chunk) for i, chunk in todo], args.batch_chars)
+    # Batching leaves few requests; don't start threads that would only sit idle.
+    workers = max(1, min(args.max_workers, len(groups)))
+    limiter = ShardedRateLimiter(interval_s=1.0 / max(0.2, args.rate_limit), shards=workers)
+    counter = Counter(total=len(todo))
+    breaker = CircuitBreaker()
+    logging.info("requests=%d (batched from %d chunks; %d already in target, %d duplicate, %d cached)", len(groups), len(todo), native, len(pending) - native - len(copies), len(copies) - len(todo))
+
+    ready = [True] * len(chunks)
+    for i, chunk in todo:
+        for j in copies[chunk]:
+            ready[j] = False
+
+    post_process = qmd_post_processor(args.source_lang, output_lang)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    part = dst.with_name(dst.name + ".part")
     try:
-        translator = GoogleTranslator(source=args.source_lang, target=resolved_target)
-        logging.info("translator backend: deep-translator/google")
-    except LanguageNotSupportedException:
-        logging.warning(
-            "deep-translator does not support '%s'; falling back to Google HTTP endpoint",
-            resolved_target,
-        )
-        translator = GoogleTranslateHttpClient(source=args.source_lang, target=resolved_target)
-        logging.info("translator backend: googleapis HTTP")
+        with part.open("w", encoding="utf-8") as fh, cf.ThreadPoolExecutor(max_workers=workers) as pool:
+            queue = iter(groups)
+            inflight: set[cf.Future[list[tuple[int, str]]]] = set()
+            written = 0
+            while True:
+                # Bound in-flight batches so out-of-order results can't pile up in memory.
+                for g in itertools.islice(queue, workers * 2 - len(inflight)):
+                    inflight.add(pool.submit(translate_group, g, translator, limiter, args.retries, counter, breaker))
+                if not inflight:
+                    break
+                finished, inflight = cf.wait(inflight, return_when=cf.FIRST_COMPLETED)
+                for fut in finished:
+                    for i, translated in fut.result():
+                        for j in copies[chunks[i]]:
+                            out[j] = translated
+                            ready[j] = True
+                        # Failed chunks come back as the source text; don't cache those.
+                        if translated != chunks[i]:
+                            cache.put(chunks[i], translated)
+                # Write out the contiguous finished prefix while later batches are still in flight.
+                while written < len(out) and ready[written]:
+                    fh.write(post_process(out[written]))
+                    out[written] = ""
+                    written += 1
+            fh.writelines(map(post_process, out[written:]))
+        part.replace(dst)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    finally:
+        cache.save()
+    logging.info("done %s -> %s in %.1fs", src.relative_to(ROOT), dst.relative_to(ROOT), time.time() - started)
 
-    limiter = RateLimiter(interval_s=1.0 / max(0.2, args.rate_limit))
-    counter = Counter(total=len(chunks))
 
-    started = time.time()
-    out = [""] * len(chunks)
-    with cf.ThreadPoolExecutor(max_workers=args.max_workers) as pool:
-        futures = [pool.submit(translate_one, i, c, translator, limiter, args.retries, counter) for i, c in enumerate(chunks)]
-        for fut in cf.as_completed(futures):
-            i, translated = fut.result()
-            out[i] = translated
+def main() -> None:
+    args = parse_args()
+    targets = args.targets
+    if len(targets) == 1:
+        args.target_lang = targets[0]
+        translate_book(args)
+        return
 
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    dst.write_text("".join(out), encoding="utf-8")
-    logging.info("done %s -> %s in %.1fs", src.relative_to(ROOT), dst.relative_to(ROOT), time.time() - started)
+    # Each language gets its own process, with its own limiter, HTTP session and cache file.
+    setup_logging(args.verbose)
+    logging.info("translating %s in parallel", ", ".join(targets))
+    jobs = [argparse.Namespace(**{**vars(args), "target_lang": t}) for t in targets]
+    failed: list[str] = []
+    with cf.ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {pool.submit(translate_book, job): job.target_lang for job in jobs}
+        for fut in cf.as_completed(futures):
+            try:
+                fut.result()
+            except Exception as exc:
+                logging.error("translation to %s failed", futures[fut], exc_info=exc)
+                failed.append(futures[fut])
+    if failed:
+        logging.error("failed targets: %s", ", ".join(failed))
+        sys.exit(1)
 
 
 if __name__ == "__main__":